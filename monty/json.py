@@ -5,14 +5,18 @@ JSON serialization and deserialization utilities.
 from __future__ import annotations
 
 import datetime
+import functools
+import importlib.util
 import json
+import math
 import os
 import pathlib
 import pickle
+import sys
 import traceback
 import types
-from collections import OrderedDict, defaultdict
-from enum import Enum
+from collections import defaultdict
+from enum import Enum, auto
 from hashlib import sha1
 from importlib import import_module
 from inspect import getfullargspec
@@ -26,53 +30,196 @@ except ImportError:
     np = None  # type: ignore
 
 try:
-    import pydantic
+    import dataclasses
 except ImportError:
-    pydantic = None  # type: ignore
+    dataclasses = None  # type: ignore
 
-try:
-    from pydantic_core import core_schema
-except ImportError:
-    core_schema = None  # type: ignore
 
-try:
-    import bson
-except ImportError:
-    bson = None  # type: ignore
+class _LazyModule:
+    """
+    Lazy stand-in for an optional dependency. The actual import is deferred
+    until an attribute is first accessed, so importing monty.json does not
+    pay the import cost of heavy optional packages such as torch or
+    pydantic. Truthiness reflects whether the package is installed, checked
+    via importlib.util.find_spec without importing it.
+    """
 
-try:
-    from ruamel.yaml import YAML
-except ImportError:
-    YAML = None  # type: ignore
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._available: bool | None = None
 
-try:
-    import orjson
-except ImportError:
-    orjson = None  # type: ignore
+    def __bool__(self) -> bool:
+        if self._available is None:
+            try:
+                self._available = (
+                    self._name in sys.modules
+                    or importlib.util.find_spec(self._name) is not None
+                )
+            except (ImportError, ValueError):
+                self._available = False
+        return self._available
 
-try:
-    import dataclasses
-except ImportError:
-    dataclasses = None  # type: ignore
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = import_module(self._name)
+        return getattr(self._module, attr)
 
-try:
-    import torch
-except ImportError:
-    torch = None  # type: ignore
+
+pydantic = _LazyModule("pydantic")
+core_schema = _LazyModule("pydantic_core.core_schema")
+bson = _LazyModule("bson")
+orjson = _LazyModule("orjson")
+torch = _LazyModule("torch")
 
 __version__ = "3.0.0"
 
 
+@functools.lru_cache(maxsize=None)
+def _orjson_options() -> int:
+    """
+    orjson.dumps options for the MSONable fast path. Keep stdlib-compatible
+    coercion of non-string keys, and keep monty's wrapper-dict format for
+    datetimes and dataclasses rather than letting orjson serialize those
+    types natively.
+    """
+    return (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson_fragment():
+    """orjson.Fragment when available (orjson >= 3.8.2), else None."""
+    return getattr(orjson, "Fragment", None) if orjson else None
+
+
+def _orjson_default(o):
+    """
+    default= hook for the orjson serialization path. Numpy arrays keep the
+    usual @module/@class wrapper, but their data is pre-serialized C-side
+    from the array buffer as an orjson.Fragment, skipping the per-element
+    Python object allocation that tolist() incurs. Complex arrays are split
+    into real/imag parts to match the wrapper convention. Everything else
+    (and any dtype orjson cannot handle natively) defers to
+    MontyEncoder.default.
+    """
+    if (
+        np is not None
+        and isinstance(o, np.ndarray)
+        and (fragment := _orjson_fragment()) is not None
+    ):
+        try:
+            if o.dtype.kind == "c":
+                data = [np.ascontiguousarray(o.real), np.ascontiguousarray(o.imag)]
+            else:
+                data = np.ascontiguousarray(o)
+            return {
+                "@module": "numpy",
+                "@class": "array",
+                "dtype": str(o.dtype),
+                "data": fragment(
+                    orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+                ),
+            }
+        except TypeError:
+            pass
+    # Objects only reached during dumping (passthrough dataclasses, nested
+    # pydantic models, ...) expand to trees the up-front fidelity walk in
+    # to_json_bytes never saw, so re-walk them here. A _NotOrjsonSafe
+    # raised from inside orjson.dumps surfaces as the __cause__ of a
+    # JSONEncodeError, which to_json_bytes unwraps.
+    return _orjson_ready(_DEFAULT_ENCODER.default(o))
+
+
+class _NotOrjsonSafe(Exception):
+    """Raised by _orjson_ready when a payload contains a value orjson cannot
+    represent faithfully, signalling a fall back to the stdlib encoder."""
+
+
+def _orjson_ready(doc):
+    """
+    Return a copy of an as_dict tree whose leaves are safe to hand to
+    orjson.dumps. orjson serializes UUIDs and Enums natively without
+    consulting default=, which would bypass the @module/@class wrappers
+    needed for round-tripping, so those are wrapped here up front. It also
+    has no token for non-finite floats (NaN/Infinity become null), so those
+    raise _NotOrjsonSafe and the caller uses the stdlib encoder instead —
+    as do float/complex ndarrays with non-finite elements, which orjson's
+    native numpy writer would corrupt the same way. Datetimes, finite
+    ndarrays and other objects are left as-is; the passthrough options
+    route them to _orjson_default during dumping.
+    """
+    result: list = [None]
+    stack: list = [(result, 0, doc)]
+    while stack:
+        target, key, o = stack.pop()
+        kind = _kind_of(type(o))
+        if kind is _Kind.DICT:
+            new_dict: dict = {}
+            target[key] = new_dict
+            for k, v in reversed(o.items()):
+                stack.append((new_dict, k, v))
+        elif kind is _Kind.LIST:
+            new_list: list = [None] * len(o)
+            target[key] = new_list
+            for idx in range(len(o) - 1, -1, -1):
+                stack.append((new_list, idx, o[idx]))
+        elif kind is _Kind.NUMBER:
+            if isinstance(o, float) and not math.isfinite(o):
+                raise _NotOrjsonSafe
+            target[key] = o
+        elif kind is _Kind.NP_SCALAR:
+            # re-walk as a plain number so non-finite values are caught
+            stack.append((target, key, o.item()))
+        elif kind is _Kind.NDARRAY:
+            # orjson's native numpy writer also emits null for non-finite
+            # elements, so those arrays must take the stdlib path too
+            if o.dtype.kind in "fc" and not np.isfinite(o).all():
+                raise _NotOrjsonSafe
+            target[key] = o
+        elif kind is _Kind.UUID:
+            target[key] = _encode_uuid(o)
+        elif kind is _Kind.ENUM:
+            # the wrapper's "value" entry may itself need conversion
+            stack.append((target, key, _DEFAULT_ENCODER.default(o)))
+        else:
+            target[key] = o
+    return result[0]
+
+
+@functools.lru_cache(maxsize=None)
 def _load_redirect(redirect_file):
     try:
-        with open(redirect_file) as f:
-            yaml = YAML()
-            d = yaml.load(f)
+        yaml_mtime = os.path.getmtime(redirect_file)
     except OSError:
         # If we can't find the file
         # Just use an empty redirect dict
         return {}
 
+    # Parsing the YAML file requires loading all of ruamel.yaml, which
+    # dominates import time for the overwhelming majority of users who never
+    # touch redirects. A JSON sidecar caches the parsed result and is reused
+    # as long as it is at least as new as the YAML file.
+    json_file = os.path.splitext(redirect_file)[0] + ".json"
+    try:
+        if os.path.getmtime(json_file) >= yaml_mtime:
+            with open(json_file, "rb") as f:
+                return orjson.loads(f.read()) if orjson else json.loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    try:
+        with open(redirect_file) as f:
+            from ruamel.yaml import YAML
+
+            yaml = YAML()
+            d = yaml.load(f)
+    except (OSError, ImportError):
+        return {}
+
     # Convert the full paths to module/class
     redirect_dict = defaultdict(dict)
     for old_path, new_path in d.items():
@@ -87,7 +234,122 @@ def _load_redirect(redirect_file):
             "@class": new_class,
         }
 
-    return dict(redirect_dict)
+    result = dict(redirect_dict)
+    try:
+        with open(json_file, "w") as f:
+            json.dump(result, f)
+    except OSError:
+        # The cache is best-effort; a read-only home dir is fine
+        pass
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _module_version(module_name: str) -> str | None:
+    """
+    Cached lookup of a module's __version__ for the @version serialization
+    key. Returns None when the module is missing or exposes no version, so
+    bulk serialization does not repeat the import machinery and
+    AttributeError handling for every object.
+    """
+    try:
+        return str(import_module(module_name).__version__)  # type: ignore
+    except (AttributeError, ImportError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _header(cls) -> dict:
+    """
+    Cached @module/@class/@version header for cls, so serializing N
+    instances of the same class builds the identifying strings once instead
+    of 3N times. Callers must copy before mutating.
+    """
+    return {
+        "@module": cls.__module__,
+        "@class": cls.__name__,
+        "@version": _module_version(cls.__module__.partition(".")[0]),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _argspec_for(cls) -> tuple[tuple[str, ...], str | None]:
+    """
+    Cached introspection of cls.__init__ for the default as_dict/from_dict
+    implementations. Returns the positional and keyword-only argument names
+    (with "self" already filtered out) and the varargs name, so repeated
+    serialization of instances of the same class pays the getfullargspec
+    cost only once.
+    """
+    spec = getfullargspec(cls.__init__)
+    args = tuple(arg for arg in spec.args + spec.kwonlyargs if arg != "self")
+    return args, spec.varargs
+
+
+@functools.lru_cache(maxsize=None)
+def _json_schema_for(cls) -> dict:
+    """
+    Cached JSON schema for an MSONable class. The schema only depends on the
+    class name and module, so pydantic schema compilation that references the
+    same class thousands of times builds it once. Callers must copy before
+    handing it to anything that mutates schemas in place.
+    """
+    return {
+        "type": "object",
+        "properties": {
+            "@class": {"enum": [cls.__name__], "type": "string"},
+            "@module": {"enum": [cls.__module__], "type": "string"},
+            "@version": {"type": "string"},
+        },
+        "required": ["@class", "@module"],
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _core_schema_for(cls):
+    """
+    Cached pydantic v2 core schema for an MSONable class. The validator and
+    therefore the schema are static per class.
+    """
+    s = core_schema.with_info_plain_validator_function(cls.validate_monty_v2)
+    return core_schema.json_or_python_schema(json_schema=s, python_schema=s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_class(modname: str, classname: str):
+    """
+    Cached import + attribute lookup of a class referenced by @module/@class,
+    so decoding a homogeneous list of dicts imports the module once. Returns
+    None when the module has no such attribute (negative caching); a missing
+    module still raises ImportError.
+    """
+    mod = __import__(modname, globals(), locals(), [classname], 0)
+    return getattr(mod, classname, None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_callable(modname: str, objname: tuple):
+    """
+    Cached resolution of an unbound @callable reference: imports the module
+    and follows the (possibly nested) attribute path. Returns None when the
+    attribute chain cannot be followed.
+    """
+    obj = __import__(modname, globals(), locals(), [objname[0]], 0)
+    try:
+        # the function could be nested, e.g. MyClass.NestedClass.function,
+        # so iteratively access the nesting
+        for attr in objname:
+            obj = getattr(obj, attr)
+        return obj
+    except AttributeError:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _type_names(tp: type) -> frozenset[str]:
+    """Cached set of fully qualified "module.name" strings for every class
+    in tp's MRO, so _check_type is a single set-membership test per call."""
+    return frozenset(f"{o.__module__}.{o.__name__}" for o in tp.__mro__)
 
 
 def _check_type(obj, type_str) -> bool:
@@ -119,12 +381,120 @@ def _check_type(obj, type_str) -> bool:
     (all objects have the builtins.object as the last one).
     """
     type_str = type_str if isinstance(type_str, tuple) else (type_str,)
-    # I believe this try-except is only necessary for callable types
-    try:
-        mro = type(obj).mro()
-    except TypeError:
-        return False
-    return any(o.__module__ + "." + o.__name__ == ts for o in mro for ts in type_str)
+    # __mro__ (unlike the mro() method) is also safe for class objects,
+    # where type(obj) is the metaclass
+    return not _type_names(type(obj)).isdisjoint(type_str)
+
+
+class _Kind(Enum):
+    """Coarse type classification shared by MontyEncoder.default and
+    jsanitize, so each object pays for the isinstance cascade once per type
+    instead of once per call."""
+
+    ENUM = auto()
+    DATETIME = auto()
+    UUID = auto()
+    PATH = auto()
+    NDARRAY = auto()
+    NP_SCALAR = auto()
+    LIST = auto()
+    DICT = auto()
+    STR = auto()
+    BYTES = auto()
+    NONE = auto()
+    NUMBER = auto()
+    TENSOR = auto()
+    DATAFRAME = auto()
+    SERIES = auto()
+    PANDAS = auto()
+    BSON_OID = auto()
+    OTHER = auto()
+
+
+@functools.lru_cache(maxsize=None)
+def _kind_of(tp: type) -> _Kind:
+    """
+    Classify a type once (cached), mirroring the branch precedence the
+    per-object isinstance chains used to apply. numpy scalar types must be
+    checked before str/bytes/number since e.g. np.float64 subclasses float.
+    The optional-dependency types are matched by qualified name via
+    _type_names so classification never forces an import.
+    """
+    if issubclass(tp, Enum):
+        return _Kind.ENUM
+    if issubclass(tp, datetime.datetime):
+        return _Kind.DATETIME
+    if issubclass(tp, UUID):
+        return _Kind.UUID
+    if issubclass(tp, Path):
+        return _Kind.PATH
+    if np is not None:
+        if issubclass(tp, np.ndarray):
+            return _Kind.NDARRAY
+        if issubclass(tp, np.generic):
+            return _Kind.NP_SCALAR
+    if issubclass(tp, (list, tuple)):
+        return _Kind.LIST
+    if issubclass(tp, dict):
+        return _Kind.DICT
+    if issubclass(tp, str):
+        return _Kind.STR
+    if issubclass(tp, bytes):
+        return _Kind.BYTES
+    if tp is type(None):
+        return _Kind.NONE
+    if issubclass(tp, (int, float)):
+        return _Kind.NUMBER
+    names = _type_names(tp)
+    if "torch.Tensor" in names:
+        return _Kind.TENSOR
+    if "pandas.core.frame.DataFrame" in names:
+        return _Kind.DATAFRAME
+    if "pandas.core.series.Series" in names:
+        return _Kind.SERIES
+    if "pandas.core.base.PandasObject" in names:
+        return _Kind.PANDAS
+    if "bson.objectid.ObjectId" in names:
+        return _Kind.BSON_OID
+    return _Kind.OTHER
+
+
+def _recursive_as_dict(obj):
+    """
+    Convert nested containers for the default MSONable.as_dict, applying the
+    as_dict protocol (and the dataclass equivalent) to every object that
+    supports it. Driven by an explicit work stack rather than recursion so
+    deeply nested payloads pay no per-level Python frame overhead. Children
+    are pushed in reverse so dict insertion order is preserved.
+    """
+    result: list = [None]
+    stack: list = [(result, 0, obj)]
+    while stack:
+        target, key, o = stack.pop()
+        if isinstance(o, (list, tuple)):
+            new_list: list = [None] * len(o)
+            target[key] = new_list
+            for idx in range(len(o) - 1, -1, -1):
+                stack.append((new_list, idx, o[idx]))
+        elif isinstance(o, dict):
+            new_dict: dict = {}
+            target[key] = new_dict
+            for k, v in reversed(o.items()):
+                stack.append((new_dict, k, v))
+        elif hasattr(o, "as_dict"):
+            target[key] = o.as_dict()
+        elif dataclasses is not None and dataclasses.is_dataclass(o):
+            d = dataclasses.asdict(o)
+            d.update(
+                {
+                    "@module": o.__class__.__module__,
+                    "@class": o.__class__.__name__,
+                }
+            )
+            target[key] = d
+        else:
+            target[key] = o
+    return result[0]
 
 
 class MSONable:
@@ -174,61 +544,32 @@ class MSONable:
         """
         A JSON serializable dict representation of an object.
         """
-        d = {
-            "@module": self.__class__.__module__,
-            "@class": self.__class__.__name__,
-        }
-
-        try:
-            parent_module = self.__class__.__module__.split(".", maxsplit=1)[0]
-            module_version = import_module(parent_module).__version__  # type: ignore
-            d["@version"] = str(module_version)
-        except (AttributeError, ImportError):
-            d["@version"] = None  # type: ignore
+        d = dict(_header(self.__class__))
 
-        spec = getfullargspec(self.__class__.__init__)
+        args, varargs = _argspec_for(self.__class__)
 
-        def recursive_as_dict(obj):
-            if isinstance(obj, (list, tuple)):
-                return [recursive_as_dict(it) for it in obj]
-            if isinstance(obj, dict):
-                return {kk: recursive_as_dict(vv) for kk, vv in obj.items()}
-            if hasattr(obj, "as_dict"):
-                return obj.as_dict()
-            if dataclasses is not None and dataclasses.is_dataclass(obj):
-                d = dataclasses.asdict(obj)
-                d.update(
-                    {
-                        "@module": obj.__class__.__module__,
-                        "@class": obj.__class__.__name__,
-                    }
-                )
-                return d
-            return obj
-
-        for c in spec.args + spec.kwonlyargs:
-            if c != "self":
+        for c in args:
+            try:
+                a = getattr(self, c)
+            except AttributeError:
                 try:
-                    a = getattr(self, c)
+                    a = getattr(self, "_" + c)
                 except AttributeError:
-                    try:
-                        a = getattr(self, "_" + c)
-                    except AttributeError:
-                        raise NotImplementedError(
-                            "Unable to automatically determine as_dict "
-                            "format from class. MSONAble requires all "
-                            "args to be present as either self.argname or "
-                            "self._argname, and kwargs to be present under "
-                            "a self.kwargs variable to automatically "
-                            "determine the dict format. Alternatively, "
-                            "you can implement both as_dict and from_dict."
-                        )
-                d[c] = recursive_as_dict(a)
+                    raise NotImplementedError(
+                        "Unable to automatically determine as_dict "
+                        "format from class. MSONAble requires all "
+                        "args to be present as either self.argname or "
+                        "self._argname, and kwargs to be present under "
+                        "a self.kwargs variable to automatically "
+                        "determine the dict format. Alternatively, "
+                        "you can implement both as_dict and from_dict."
+                    )
+            d[c] = _recursive_as_dict(a)
         if hasattr(self, "kwargs"):
             # type: ignore
             d.update(**self.kwargs)  # pylint: disable=E1101
-        if spec.varargs is not None and getattr(self, spec.varargs, None) is not None:
-            d.update({spec.varargs: getattr(self, spec.varargs)})
+        if varargs is not None and getattr(self, varargs, None) is not None:
+            d.update({varargs: getattr(self, varargs)})
         if hasattr(self, "_kwargs"):
             d.update(**self._kwargs)  # pylint: disable=E1101
         if isinstance(self, Enum):
@@ -242,17 +583,48 @@ class MSONable:
         :return: MSONable class.
         """
         decoded = {
-            k: MontyDecoder().process_decoded(v)
-            for k, v in d.items()
-            if not k.startswith("@")
+            k: _DECODER.process_decoded(v) for k, v in d.items() if k[:1] != "@"
         }
         return cls(**decoded)
 
     def to_json(self) -> str:
         """
         Returns a json string representation of the MSONable object.
+
+        Serialization goes through orjson's C-level writer when orjson is
+        installed, falling back to the stdlib json module otherwise.
+        """
+        return self.to_json_bytes().decode("utf-8")
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Returns a utf-8 encoded json representation of the MSONable object.
+
+        Skips the bytes -> str round-trip of to_json for callers writing
+        directly to sockets or binary file handles.
         """
-        return json.dumps(self, cls=MontyEncoder)
+        if orjson:
+            try:
+                return orjson.dumps(
+                    _orjson_ready(_DEFAULT_ENCODER.default(self)),
+                    default=_orjson_default,
+                    option=_orjson_options(),
+                )
+            except _NotOrjsonSafe:
+                # Non-finite floats have no orjson token; the stdlib
+                # encoder emits NaN/Infinity, which the decoder accepts.
+                pass
+            except orjson.JSONEncodeError as exc:
+                # A _NotOrjsonSafe raised inside default= arrives wrapped:
+                # newer orjson chains it as __cause__, 3.8.x swallows it
+                # entirely (__cause__ is None). In the latter case retry
+                # with the stdlib encoder, which either succeeds or raises
+                # its own informative TypeError.
+                if exc.__cause__ is not None and not isinstance(
+                    exc.__cause__, _NotOrjsonSafe
+                ):
+                    raise
+        return json.dumps(self, cls=MontyEncoder).encode("utf-8")
 
     def unsafe_hash(self):
         """
@@ -261,33 +633,40 @@ class MSONable:
         any nested keys, and then performing a hash on the resulting object
         """
 
-        def flatten(obj, separator="."):
-            # Flattens a dictionary
-
-            flat_dict = {}
-            for key, value in obj.items():
-                if isinstance(value, dict):
-                    flat_dict.update(
-                        {
-                            separator.join([key, _key]): _value
-                            for _key, _value in flatten(value).items()
-                        }
-                    )
-                elif isinstance(value, list):
-                    list_dict = {
-                        f"{key}{separator}{num}": item for num, item in enumerate(value)
-                    }
-                    flat_dict.update(flatten(list_dict))
-                else:
-                    flat_dict[key] = value
-
-            return flat_dict
-
-        ordered_keys = sorted(
-            flatten(jsanitize(self.as_dict())).items(), key=lambda x: x[0]
-        )
-        ordered_keys = [item for item in ordered_keys if "@" not in item[0]]
-        return sha1(json.dumps(OrderedDict(ordered_keys)).encode("utf-8"))
+        def flatten(obj, prefix=""):
+            # Single-pass DFS yielding (dotted_key, leaf_value) pairs, so no
+            # intermediate dict is allocated per nesting level.
+            if isinstance(obj, dict):
+                for key, value in obj.items():
+                    yield from flatten(value, f"{prefix}.{key}" if prefix else key)
+            elif isinstance(obj, list):
+                for num, item in enumerate(obj):
+                    yield from flatten(item, f"{prefix}.{num}" if prefix else str(num))
+            else:
+                yield prefix, obj
+
+        # Stream the sorted flattened items straight into the hash instead of
+        # materializing an OrderedDict and one monolithic json string. The
+        # byte stream reproduces the old json.dumps output exactly, so
+        # digests are unchanged.
+        h = sha1(b"{")
+        first = True
+        for key, value in sorted(
+            (
+                kv
+                for kv in flatten(jsanitize(self.as_dict()))
+                if "@" not in kv[0]
+            ),
+            key=lambda kv: kv[0],
+        ):
+            if not first:
+                h.update(b", ")
+            first = False
+            h.update(json.dumps(key).encode("utf-8"))
+            h.update(b": ")
+            h.update(json.dumps(value).encode("utf-8"))
+        h.update(b"}")
+        return h
 
     @classmethod
     def _validate_monty(cls, __input_value):
@@ -300,7 +679,7 @@ class MSONable:
             # Do not allow generic exceptions to be raised during deserialization
             # since pydantic may handle them incorrectly.
             try:
-                new_obj = MontyDecoder().process_decoded(__input_value)
+                new_obj = _DECODER.process_decoded(__input_value)
                 if isinstance(new_obj, cls):
                     return new_obj
                 return cls(**__input_value)
@@ -338,24 +717,17 @@ class MSONable:
         """
         pydantic v2 core schema definition
         """
-        if core_schema is None:
+        if not core_schema:
             raise RuntimeError("Pydantic >= 2.0 is required for validation")
 
-        s = core_schema.with_info_plain_validator_function(cls.validate_monty_v2)
-
-        return core_schema.json_or_python_schema(json_schema=s, python_schema=s)
+        return _core_schema_for(cls)
 
     @classmethod
     def _generic_json_schema(cls):
-        return {
-            "type": "object",
-            "properties": {
-                "@class": {"enum": [cls.__name__], "type": "string"},
-                "@module": {"enum": [cls.__module__], "type": "string"},
-                "@version": {"type": "string"},
-            },
-            "required": ["@class", "@module"],
-        }
+        cached = _json_schema_for(cls)
+        # Return a fresh copy each call: pydantic mutates the schema it is
+        # handed (e.g. adding "title"), which would corrupt the cached dict.
+        return {**cached, "properties": dict(cached["properties"])}
 
     @classmethod
     def __get_pydantic_json_schema__(cls, core_schema, handler):
@@ -538,6 +910,92 @@ def _recursive_name_object_map_replacement(d, name_object_map):
     return d
 
 
+def _encode_datetime(o) -> dict:
+    return {"@module": "datetime", "@class": "datetime", "string": str(o)}
+
+
+def _encode_uuid(o) -> dict:
+    return {"@module": "uuid", "@class": "UUID", "string": str(o)}
+
+
+def _encode_path(o) -> dict:
+    return {"@module": "pathlib", "@class": "Path", "string": str(o)}
+
+
+def _encode_ndarray(o) -> dict:
+    if str(o.dtype).startswith("complex"):
+        return {
+            "@module": "numpy",
+            "@class": "array",
+            "dtype": str(o.dtype),
+            "data": [o.real.tolist(), o.imag.tolist()],
+        }
+    return {
+        "@module": "numpy",
+        "@class": "array",
+        "dtype": str(o.dtype),
+        "data": o.tolist(),
+    }
+
+
+def _encode_tensor(o) -> dict:
+    d = {
+        "@module": "torch",
+        "@class": "Tensor",
+        "dtype": o.type(),
+    }
+    if "Complex" in o.type():
+        d["data"] = [o.real.tolist(), o.imag.tolist()]
+    else:
+        d["data"] = o.numpy().tolist()
+    return d
+
+
+def _encode_dataframe(o) -> dict:
+    return {
+        "@module": "pandas",
+        "@class": "DataFrame",
+        "data": o.to_json(default_handler=_DEFAULT_ENCODER.encode),
+    }
+
+
+def _encode_series(o) -> dict:
+    return {
+        "@module": "pandas",
+        "@class": "Series",
+        "data": o.to_json(default_handler=_DEFAULT_ENCODER.encode),
+    }
+
+
+def _encode_objectid(o) -> dict:
+    return {
+        "@module": "bson.objectid",
+        "@class": "ObjectId",
+        "oid": str(o),
+    }
+
+
+def _encode_np_scalar(o):
+    return o.item()
+
+
+# Kind dispatch for MontyEncoder.default: objects of these kinds go straight
+# to their handler via a single dict lookup (the per-type classification is
+# cached in _kind_of). Everything else falls through to the
+# callable/pydantic/dataclass/as_dict chain.
+_ENCODE_BY_KIND: Dict[_Kind, Any] = {
+    _Kind.DATETIME: _encode_datetime,
+    _Kind.UUID: _encode_uuid,
+    _Kind.PATH: _encode_path,
+    _Kind.TENSOR: _encode_tensor,
+    _Kind.NDARRAY: _encode_ndarray,
+    _Kind.NP_SCALAR: _encode_np_scalar,
+    _Kind.DATAFRAME: _encode_dataframe,
+    _Kind.SERIES: _encode_series,
+    _Kind.BSON_OID: _encode_objectid,
+}
+
+
 class MontyEncoder(json.JSONEncoder):
     """
     A Json Encoder which supports the MSONable API, plus adds support for
@@ -571,67 +1029,9 @@ class MontyEncoder(json.JSONEncoder):
         Return:
             Python dict representation.
         """
-        if isinstance(o, datetime.datetime):
-            return {
-                "@module": "datetime",
-                "@class": "datetime",
-                "string": str(o),
-            }
-        if isinstance(o, UUID):
-            return {"@module": "uuid", "@class": "UUID", "string": str(o)}
-        if isinstance(o, Path):
-            return {"@module": "pathlib", "@class": "Path", "string": str(o)}
-
-        if torch is not None and isinstance(o, torch.Tensor):
-            # Support for Pytorch Tensors.
-            d = {
-                "@module": "torch",
-                "@class": "Tensor",
-                "dtype": o.type(),
-            }
-            if "Complex" in o.type():
-                d["data"] = [o.real.tolist(), o.imag.tolist()]  # type: ignore
-            else:
-                d["data"] = o.numpy().tolist()
-            return d
-
-        if np is not None:
-            if isinstance(o, np.ndarray):
-                if str(o.dtype).startswith("complex"):
-                    return {
-                        "@module": "numpy",
-                        "@class": "array",
-                        "dtype": str(o.dtype),
-                        "data": [o.real.tolist(), o.imag.tolist()],
-                    }
-                return {
-                    "@module": "numpy",
-                    "@class": "array",
-                    "dtype": str(o.dtype),
-                    "data": o.tolist(),
-                }
-            if isinstance(o, np.generic):
-                return o.item()
-
-        if _check_type(o, "pandas.core.frame.DataFrame"):
-            return {
-                "@module": "pandas",
-                "@class": "DataFrame",
-                "data": o.to_json(default_handler=MontyEncoder().encode),
-            }
-        if _check_type(o, "pandas.core.series.Series"):
-            return {
-                "@module": "pandas",
-                "@class": "Series",
-                "data": o.to_json(default_handler=MontyEncoder().encode),
-            }
-
-        if bson is not None and isinstance(o, bson.objectid.ObjectId):
-            return {
-                "@module": "bson.objectid",
-                "@class": "ObjectId",
-                "oid": str(o),
-            }
+        handler = _ENCODE_BY_KIND.get(_kind_of(type(o)))
+        if handler is not None:
+            return handler(o)
 
         if callable(o) and not isinstance(o, MSONable):
             try:
@@ -643,7 +1043,7 @@ class MontyEncoder(json.JSONEncoder):
                 raise AttributeError(e)
 
         try:
-            if pydantic is not None and isinstance(o, pydantic.BaseModel):
+            if _check_type(o, "pydantic.main.BaseModel"):
                 d = o.dict()
             elif (
                 dataclasses is not None
@@ -671,18 +1071,20 @@ class MontyEncoder(json.JSONEncoder):
             if "@class" not in d:
                 d["@class"] = str(o.__class__.__name__)
             if "@version" not in d:
-                try:
-                    parent_module = o.__class__.__module__.split(".")[0]
-                    module_version = import_module(parent_module).__version__  # type: ignore
-                    d["@version"] = str(module_version)
-                except (AttributeError, ImportError):
-                    d["@version"] = None  # type: ignore
+                d["@version"] = _module_version(  # type: ignore
+                    o.__class__.__module__.partition(".")[0]
+                )
             return d
         except AttributeError:
             return json.JSONEncoder.default(self, o)
 
 
-class MontyDecoder(json.JSONDecoder):
+# Shared stateless instance so hot paths don't construct a fresh encoder per
+# object. MontyEncoder keeps no mutable state, so default/encode are reentrant.
+_DEFAULT_ENCODER = MontyEncoder()
+
+
+class MontyDecoder:
     """
     A Json Decoder which supports the MSONable API. By default, the
     decoder attempts to find a module and name associated with a dict. If
@@ -691,12 +1093,22 @@ class MontyDecoder(json.JSONDecoder):
     nested lists and dicts containing pymatgen object will be decoded correctly
     as well.
 
+    This is deliberately not a json.JSONDecoder subclass: decoding goes
+    through orjson when available, so the stdlib scanner machinery is never
+    used. The class still works as a *cls* keyword for json.load(s), which
+    only requires a decode method.
+
     Usage:
 
         # Add it as a *cls* keyword when using json.load
         json.loads(json_string, cls=MontyDecoder)
     """
 
+    def __init__(self, *args, **kwargs):
+        # Accept (and ignore) the json.JSONDecoder arguments that
+        # json.load(s) may pass when used via the cls keyword.
+        pass
+
     def process_decoded(self, d):
         """
         Recursive method to support decoding dicts and lists containing
@@ -718,22 +1130,23 @@ class MontyDecoder(json.JSONDecoder):
                     # deserialize the bound object and then remove the object name
                     # from the function name.
                     obj = self.process_decoded(d["@bound"])
-                    objname = objname.split(".")[1:]
-                else:
-                    # if the function is not bound to an object, import the
-                    # function from the module name
-                    obj = __import__(modname, globals(), locals(), [objname], 0)
-                    objname = objname.split(".")
-                try:
-                    # the function could be nested. e.g., MyClass.NestedClass.function
-                    # so iteratively access the nesting
-                    for attr in objname:
-                        obj = getattr(obj, attr)
+                    try:
+                        # the function could be nested. e.g.,
+                        # MyClass.NestedClass.function, so iteratively access
+                        # the nesting
+                        for attr in objname.split(".")[1:]:
+                            obj = getattr(obj, attr)
 
-                    return obj
+                        return obj
 
-                except AttributeError:
-                    pass
+                    except AttributeError:
+                        pass
+                else:
+                    # if the function is not bound to an object, import the
+                    # function from the module name (cached per reference)
+                    obj = _resolve_callable(modname, tuple(objname.split(".")))
+                    if obj is not None:
+                        return obj
             else:
                 modname = None
                 classname = None
@@ -746,6 +1159,19 @@ class MontyDecoder(json.JSONDecoder):
                     "torch",
                 ]:
                     if modname == "datetime" and classname == "datetime":
+                        # fromisoformat is C-implemented and parses the
+                        # str(datetime) output MontyEncoder emits far faster
+                        # than strptime, which re-reads its format spec on
+                        # every call. strptime remains as fallback for
+                        # legacy payloads. A trailing Z is normalized for
+                        # Python < 3.11 compatibility.
+                        string = d["string"]
+                        if string.endswith("Z"):
+                            string = string[:-1] + "+00:00"
+                        try:
+                            return datetime.datetime.fromisoformat(string)
+                        except ValueError:
+                            pass
                         try:
                             dt = datetime.datetime.strptime(
                                 d["string"], "%Y-%m-%d %H:%M:%S.%f"
@@ -762,15 +1188,17 @@ class MontyDecoder(json.JSONDecoder):
                     if modname == "pathlib" and classname == "Path":
                         return Path(d["string"])
 
-                    mod = __import__(modname, globals(), locals(), [classname], 0)
-                    if hasattr(mod, classname):
-                        cls_ = getattr(mod, classname)
-                        data = {k: v for k, v in d.items() if not k.startswith("@")}
+                    cls_ = _resolve_class(modname, classname)
+                    if cls_ is not None:
+                        data = {k: v for k, v in d.items() if k[:1] != "@"}
                         if hasattr(cls_, "from_dict"):
                             return cls_.from_dict(data)
                         if issubclass(cls_, Enum):
                             return cls_(d["value"])
-                        if pydantic is not None and issubclass(
+                        # A pydantic model class can only exist if pydantic is
+                        # already imported, so checking sys.modules avoids
+                        # triggering the import for non-pydantic classes.
+                        if "pydantic" in sys.modules and issubclass(
                             cls_, pydantic.BaseModel
                         ):  # pylint: disable=E1101
                             d = {k: self.process_decoded(v) for k, v in data.items()}
@@ -782,39 +1210,28 @@ class MontyDecoder(json.JSONDecoder):
                         ):
                             d = {k: self.process_decoded(v) for k, v in data.items()}
                             return cls_(**d)
-                elif torch is not None and modname == "torch" and classname == "Tensor":
+                elif modname == "torch" and classname == "Tensor" and torch:
                     if "Complex" in d["dtype"]:
-                        return torch.tensor(  # pylint: disable=E1101
-                            [
-                                np.array(r) + np.array(i) * 1j
-                                for r, i in zip(*d["data"])
-                            ],
-                        ).type(d["dtype"])
+                        # One vectorized complex-add over the real/imag parts
+                        # instead of building an ndarray per row.
+                        arr = np.asarray(d["data"][0]) + 1j * np.asarray(d["data"][1])
+                        return torch.tensor(arr).type(d["dtype"])  # pylint: disable=E1101
                     return torch.tensor(d["data"]).type(d["dtype"])  # pylint: disable=E1101
                 elif np is not None and modname == "numpy" and classname == "array":
                     if d["dtype"].startswith("complex"):
-                        return np.array(
-                            [
-                                np.array(r) + np.array(i) * 1j
-                                for r, i in zip(*d["data"])
-                            ],
-                            dtype=d["dtype"],
-                        )
+                        arr = np.asarray(d["data"][0]) + 1j * np.asarray(d["data"][1])
+                        return arr.astype(d["dtype"], copy=False)
                     return np.array(d["data"], dtype=d["dtype"])
                 elif modname == "pandas":
                     import pandas as pd
 
                     if classname == "DataFrame":
-                        decoded_data = MontyDecoder().decode(d["data"])
+                        decoded_data = self.decode(d["data"])
                         return pd.DataFrame(decoded_data)
                     if classname == "Series":
-                        decoded_data = MontyDecoder().decode(d["data"])
+                        decoded_data = self.decode(d["data"])
                         return pd.Series(decoded_data)
-                elif (
-                    (bson is not None)
-                    and modname == "bson.objectid"
-                    and classname == "ObjectId"
-                ):
+                elif modname == "bson.objectid" and classname == "ObjectId" and bson:
                     return bson.objectid.ObjectId(d["oid"])
 
             return {
@@ -828,12 +1245,15 @@ class MontyDecoder(json.JSONDecoder):
 
     def decode(self, s):
         """
-        Overrides decode from JSONDecoder.
+        Decode a json string or bytes into the corresponding object.
 
-        :param s: string
+        orjson is preferred when installed: it accepts bytes natively,
+        avoiding an extra decode step.
+
+        :param s: string or bytes
         :return: Object.
         """
-        if orjson is not None:
+        if orjson:
             try:
                 d = orjson.loads(s)  # pylint: disable=E1101
             except orjson.JSONDecodeError:  # pylint: disable=E1101
@@ -843,18 +1263,27 @@ class MontyDecoder(json.JSONDecoder):
         return self.process_decoded(d)
 
 
+_DECODER = MontyDecoder()
+
+
 class MSONError(Exception):
     """
     Exception class for serialization errors.
     """
 
 
+# Types that need no sanitization; containers holding only these (with str
+# keys) can be shallow-copied instead of traversed element by element.
+_LEAF_TYPES = (str, int, float, bool, type(None))
+
+
 def jsanitize(
     obj,
     strict=False,
     allow_bson=False,
     enum_values=False,
     recursive_msonable=False,
+    _assume_clean=False,
 ):
     """
     This method cleans an input json-like object, either a list or a dict or
@@ -877,110 +1306,185 @@ def jsanitize(
         enum_values (bool): Convert Enums to their values.
         recursive_msonable (bool): If True, uses .as_dict() for MSONables regardless
             of the value of strict.
+        _assume_clean (bool): If True, dict keys are trusted to already be
+            strings and leaf values (str/int/float/bool/None) are copied
+            without inspection, so only non-leaf values are walked. Intended
+            for callers that sanitize defensively and usually pass data that
+            is already JSON-clean.
 
     Returns:
         Sanitized dict that can be json serialized.
     """
-    if isinstance(obj, Enum):
-        if enum_values:
-            return obj.value
-        elif hasattr(obj, "as_dict"):
-            return obj.as_dict()
-        return MontyEncoder().default(obj)
-
-    if allow_bson and (
-        isinstance(obj, (datetime.datetime, bytes))
-        or (bson is not None and isinstance(obj, bson.objectid.ObjectId))
-    ):
-        return obj
-    if isinstance(obj, (list, tuple)):
-        return [
-            jsanitize(
-                i,
-                strict=strict,
-                allow_bson=allow_bson,
-                enum_values=enum_values,
-                recursive_msonable=recursive_msonable,
-            )
-            for i in obj
-        ]
-    if np is not None and isinstance(obj, np.ndarray):
-        try:
-            return [
-                jsanitize(
-                    i,
-                    strict=strict,
-                    allow_bson=allow_bson,
-                    enum_values=enum_values,
-                    recursive_msonable=recursive_msonable,
-                )
-                for i in obj.tolist()
-            ]
-        except TypeError:
-            return obj.tolist()
-    if np is not None and isinstance(obj, np.generic):
-        return obj.item()
-    if _check_type(
-        obj,
-        (
-            "pandas.core.series.Series",
-            "pandas.core.frame.DataFrame",
-            "pandas.core.base.PandasObject",
-        ),
-    ):
-        return obj.to_dict()
-    if isinstance(obj, dict):
-        return {
-            str(k): jsanitize(
-                v,
-                strict=strict,
-                allow_bson=allow_bson,
-                enum_values=enum_values,
-                recursive_msonable=recursive_msonable,
-            )
-            for k, v in obj.items()
-        }
-    if isinstance(obj, (int, float)):
-        return obj
-    if obj is None:
-        return None
-    if isinstance(obj, (pathlib.Path, datetime.datetime)):
-        return str(obj)
+    # Driven by an explicit work stack rather than recursion: each item
+    # writes its sanitized result into target[key], and container children
+    # are pushed in reverse so dict insertion order is preserved. This
+    # avoids one Python frame per nesting level on large payloads and the
+    # attendant recursion-limit risk.
+    result: list = [None]
+    stack: list = [(result, 0, obj)]
+    while stack:
+        target, key, o = stack.pop()
+        kind = _kind_of(type(o))
+        if kind is _Kind.ENUM:
+            if enum_values:
+                target[key] = o.value
+            elif hasattr(o, "as_dict"):
+                target[key] = o.as_dict()
+            else:
+                target[key] = _DEFAULT_ENCODER.default(o)
+        elif allow_bson and kind in (_Kind.DATETIME, _Kind.BYTES, _Kind.BSON_OID):
+            target[key] = o
+        elif kind is _Kind.LIST:
+            if all(type(v) in _LEAF_TYPES for v in o):
+                target[key] = list(o)
+            else:
+                new_list: list = [None] * len(o)
+                target[key] = new_list
+                for idx in range(len(o) - 1, -1, -1):
+                    stack.append((new_list, idx, o[idx]))
+        elif kind is _Kind.NDARRAY:
+            # Arrays of simple kinds (bool/int/uint/float/str) convert to
+            # already-clean Python scalars in one C-level bulk operation, so
+            # element-wise traversal is only needed for object arrays and
+            # other exotic dtypes.
+            if o.dtype.kind in "biufU":
+                target[key] = o.tolist()
+            elif o.dtype.kind == "c":
+                # Split into real/imag parts to match the encoder convention.
+                target[key] = [o.real.tolist(), o.imag.tolist()]
+            else:
+                try:
+                    items = list(o.tolist())
+                except TypeError:
+                    # zero-dimensional arrays yield a bare scalar
+                    target[key] = o.tolist()
+                else:
+                    new_list = [None] * len(items)
+                    target[key] = new_list
+                    for idx in range(len(items) - 1, -1, -1):
+                        stack.append((new_list, idx, items[idx]))
+        elif kind is _Kind.NP_SCALAR:
+            target[key] = o.item()
+        elif kind in (_Kind.SERIES, _Kind.DATAFRAME, _Kind.PANDAS):
+            target[key] = o.to_dict()
+        elif kind is _Kind.DICT:
+            if _assume_clean:
+                new_dict = dict(o)
+                target[key] = new_dict
+                for k, v in reversed(o.items()):
+                    if type(v) not in _LEAF_TYPES:
+                        stack.append((new_dict, k, v))
+            elif all(type(k) is str for k in o) and all(
+                type(v) in _LEAF_TYPES for v in o.values()
+            ):
+                # dict(o) rather than o.copy() so subclasses such as
+                # defaultdict come back as plain dicts
+                target[key] = dict(o)
+            else:
+                new_dict: dict = {}
+                target[key] = new_dict
+                for k, v in reversed(o.items()):
+                    stack.append((new_dict, str(k), v))
+        elif kind in (_Kind.NUMBER, _Kind.NONE):
+            target[key] = o
+        elif kind in (_Kind.PATH, _Kind.DATETIME):
+            target[key] = str(o)
+        elif kind is _Kind.STR:
+            target[key] = o
+        else:
+            if callable(o) and not isinstance(o, MSONable):
+                try:
+                    target[key] = _serialize_callable(o)
+                    continue
+                except TypeError:
+                    pass
+            if recursive_msonable:
+                try:
+                    target[key] = o.as_dict()
+                    continue
+                except AttributeError:
+                    pass
+            if not strict:
+                target[key] = str(o)
+            elif _check_type(o, "pydantic.main.BaseModel"):
+                # Re-enter the loop with the encoded model so its contents
+                # get sanitized as well.
+                stack.append((target, key, _DEFAULT_ENCODER.default(o)))
+            else:
+                stack.append((target, key, o.as_dict()))
+    return result[0]
 
-    if callable(obj) and not isinstance(obj, MSONable):
-        try:
-            return _serialize_callable(obj)
-        except TypeError:
-            pass
 
-    if recursive_msonable:
-        try:
-            return obj.as_dict()
-        except AttributeError:
-            pass
+def jsanitize_inplace(
+    obj,
+    strict=False,
+    allow_bson=False,
+    enum_values=False,
+    recursive_msonable=False,
+):
+    """
+    Variant of jsanitize that mutates dicts and lists in place instead of
+    building a parallel copy of the structure, roughly halving peak memory
+    on large payloads.
 
-    if not strict:
-        return str(obj)
+    The return value aliases the input: ``obj`` and every dict/list nested
+    inside it are modified and returned as-is, so callers must not rely on
+    keeping an unsanitized copy. The input must be acyclic; self-referencing
+    containers will loop forever. Non-container leaf values are converted
+    with jsanitize, so e.g. tuples are still replaced by new lists.
 
-    if isinstance(obj, str):
-        return obj
+    Args:
+        obj: input json-like object.
+        strict (bool): See jsanitize.
+        allow_bson (bool): See jsanitize.
+        enum_values (bool): See jsanitize.
+        recursive_msonable (bool): See jsanitize.
 
-    if pydantic is not None and isinstance(obj, pydantic.BaseModel):  # pylint: disable=E1101
+    Returns:
+        The sanitized input object.
+    """
+    if not isinstance(obj, (dict, list)):
         return jsanitize(
-            MontyEncoder().default(obj),
+            obj,
             strict=strict,
             allow_bson=allow_bson,
             enum_values=enum_values,
             recursive_msonable=recursive_msonable,
         )
-
-    return jsanitize(
-        obj.as_dict(),
-        strict=strict,
-        allow_bson=allow_bson,
-        enum_values=enum_values,
-        recursive_msonable=recursive_msonable,
-    )
+    stack: list = [obj]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            for k in [k for k in container if type(k) is not str]:
+                container[str(k)] = container.pop(k)
+            for k, v in container.items():
+                if type(v) in _LEAF_TYPES:
+                    continue
+                if type(v) in (dict, list):
+                    stack.append(v)
+                else:
+                    container[k] = jsanitize(
+                        v,
+                        strict=strict,
+                        allow_bson=allow_bson,
+                        enum_values=enum_values,
+                        recursive_msonable=recursive_msonable,
+                    )
+        else:
+            for idx, v in enumerate(container):
+                if type(v) in _LEAF_TYPES:
+                    continue
+                if type(v) in (dict, list):
+                    stack.append(v)
+                else:
+                    container[idx] = jsanitize(
+                        v,
+                        strict=strict,
+                        allow_bson=allow_bson,
+                        enum_values=enum_values,
+                        recursive_msonable=recursive_msonable,
+                    )
+    return obj
 
 
 def _serialize_callable(o):
@@ -996,7 +1500,7 @@ def _serialize_callable(o):
     # bound to is itself serializable
     if bound is not None:
         try:
-            bound = MontyEncoder().default(bound)
+            bound = _DEFAULT_ENCODER.default(bound)
         except TypeError:
             raise TypeError(
                 "Only bound methods of classes or MSONable instances are supported."
@@ -3,10 +3,12 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import json
+import math
 import os
 import pathlib
 from enum import Enum
 from typing import Union
+from uuid import UUID, uuid4
 
 try:
     import numpy as np
@@ -41,6 +43,7 @@ from monty.json import (
     MSONable,
     _load_redirect,
     jsanitize,
+    jsanitize_inplace,
     load,
 )
 
@@ -272,6 +275,59 @@ class TestMSONable:
         d = json.loads(jsonstr)
         assert d["@class"], "ClassContainingKWOnlyArgs"
 
+    def test_to_json_bytes(self):
+        obj = self.good_cls("Hello", "World", "Python")
+        json_bytes = obj.to_json_bytes()
+        assert isinstance(json_bytes, bytes)
+        d = json.loads(json_bytes)
+        assert d["@class"] == "GoodMSONClass"
+        assert json.loads(obj.to_json()) == d
+
+    def test_to_json_round_trip(self):
+        # types orjson would serialize natively must keep their MSON wrappers
+        uuid = uuid4()
+        obj = self.good_cls(
+            uuid, EnumNoAsDict.name_a, {"dt": datetime.datetime(2023, 1, 2, 3, 4, 5)}
+        )
+        decoded = MontyDecoder().decode(obj.to_json())
+        assert isinstance(decoded.a, UUID)
+        assert decoded.a == uuid
+        assert decoded.b is EnumNoAsDict.name_a
+        assert decoded._c["dt"] == datetime.datetime(2023, 1, 2, 3, 4, 5)
+
+        # non-finite floats must survive the round trip, not decay to null
+        obj = self.good_cls(float("nan"), float("inf"), [1.5, float("-inf")])
+        decoded = MontyDecoder().decode(obj.to_json())
+        assert math.isnan(decoded.a)
+        assert decoded.b == math.inf
+        assert decoded._c == [1.5, -math.inf]
+
+    @pytest.mark.skipif(np is None, reason="numpy not present")
+    def test_to_json_numpy_round_trip(self):
+        arrays = [
+            np.arange(6, dtype=np.int32).reshape(2, 3),
+            np.array([1.5, 2.5]),
+            np.array([True, False]),
+            np.array(["a", "bc"]),
+            np.array([1 + 2j, 3 - 4j]),
+            np.array([[1 + 2j], [3 - 4j]], dtype=np.complex64),
+            # float16 is not supported by orjson's native numpy writer and
+            # must take the tolist fallback
+            np.array([1.0, 2.5], dtype=np.float16),
+            # non-finite elements force the stdlib NaN/Infinity fallback
+            np.array([1.5, np.nan, np.inf, -np.inf]),
+            np.array([1 + 2j, complex(np.inf, np.nan)]),
+        ]
+        for arr in arrays:
+            obj = ClassContainingNumpyArray(arr)
+            decoded = MontyDecoder().decode(obj.to_json())
+            assert isinstance(decoded.np_a, np.ndarray)
+            assert decoded.np_a.dtype == arr.dtype
+            # equal_nan is not supported for non-numeric dtypes
+            assert np.array_equal(
+                decoded.np_a, arr, equal_nan=arr.dtype.kind in "fc"
+            )
+
     def test_unsafe_hash(self):
         GMC = GoodMSONClass
         a_list = [GMC(1, 1.0, "one"), GMC(2, 2.0, "two")]
@@ -829,6 +885,35 @@ class TestJson:
         clean = jsanitize(d, strict=True)
         assert "@class" in clean["c"]
 
+    def test_jsanitize_assume_clean(self):
+        d = {"a": 1, "b": {"c": [1, 2, "x"], "dt": datetime.datetime.now()}}
+        clean = jsanitize(d, _assume_clean=True)
+        assert clean is not d
+        assert clean["a"] == 1
+        assert isinstance(clean["b"]["dt"], str)
+
+    def test_jsanitize_inplace(self):
+        d = {
+            "a": 1,
+            "nested": {1: "one", "dt": datetime.datetime.now()},
+            "lst": ["x", (1, 2), GoodMSONClass(1, 2, 3)],
+        }
+        nested = d["nested"]
+        lst = d["lst"]
+        clean = jsanitize_inplace(d, strict=True)
+        # the same containers are returned, mutated
+        assert clean is d
+        assert clean["nested"] is nested
+        assert clean["lst"] is lst
+        assert clean["nested"]["1"] == "one"
+        assert isinstance(clean["nested"]["dt"], str)
+        assert clean["lst"][1] == [1, 2]
+        assert clean["lst"][2]["a"] == 1
+        json.dumps(clean)
+
+        # non-container input falls back to jsanitize
+        assert isinstance(jsanitize_inplace(pathlib.Path("/home/user")), str)
+
     @pytest.mark.skipif(pd is None, reason="pandas not present")
     def test_jsanitize_pandas(self):
         s = pd.Series({"a": [1, 2, 3], "b": [4, 5, 6]})
@@ -880,14 +965,29 @@ class TestJson:
             # AnotherClass from tests.test_json instead of tests.test_json2
             json.loads(json.dumps(d2), cls=MontyDecoder)
 
-    def test_redirect_settings_file(self):
-        data = _load_redirect(os.path.join(test_dir, "test_settings.yaml"))
-        assert data == {
+    def test_redirect_settings_file(self, tmp_path):
+        import shutil
+
+        settings_file = tmp_path / "test_settings.yaml"
+        shutil.copy(os.path.join(test_dir, "test_settings.yaml"), settings_file)
+
+        expected = {
             "old_module": {
                 "old_class": {"@class": "new_class", "@module": "new_module"}
             }
         }
 
+        _load_redirect.cache_clear()
+        data = _load_redirect(str(settings_file))
+        assert data == expected
+
+        # A JSON sidecar should have been written and should be served on
+        # subsequent loads without re-parsing the YAML file.
+        assert (tmp_path / "test_settings.json").exists()
+        _load_redirect.cache_clear()
+        data = _load_redirect(str(settings_file))
+        assert data == expected
+
     @pytest.mark.skipif(pydantic is None, reason="pydantic not present")
     def test_pydantic_integrations(self):
         from pydantic import BaseModel, ValidationError